@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import (
@@ -19,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
@@ -26,6 +30,7 @@ from .const import (
     CONF_MAC_ADDRESS,
     DEFAULT_LOCK_LOG_MAX_ENTRIES,
     DOMAIN,
+    LOG_FETCH_DELAY,
     LOGGER,
     SERVICE_DELETE_LOCK_USER_NAME,
     SERVICE_GET_LOCK_LOGS,
@@ -44,6 +49,27 @@ if TYPE_CHECKING:
 # Integration can only be configured via config entries
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Coerce user_id to int at the service boundary (matching the 0-255 number
+# selector in services.yaml) so the storage layer only ever sees int keys;
+# YAML service calls would otherwise hand us strings that never match the
+# int-keyed user lookups during log enrichment
+_USER_ID_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=0, max=255))
+
+SERVICE_SET_LOCK_USER_NAME_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+        vol.Required("user_id"): _USER_ID_SCHEMA,
+        vol.Required("name"): cv.string,
+    }
+)
+
+SERVICE_DELETE_LOCK_USER_NAME_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+        vol.Required("user_id"): _USER_ID_SCHEMA,
+    }
+)
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 
@@ -52,8 +78,11 @@ class SwitchBotLockLogsData:
     """Runtime data for a SwitchBot Lock Logs config entry."""
 
     log_manager: SwitchBotLockLogManager
+    device_id: str
     mac_address: str
+    fetch_debouncer: Debouncer[list[dict[str, Any]]] | None = None
     cancel_state_listener: Callable[[], None] | None = None
+    last_lock_state: str | None = None
 
 
 type SwitchBotLockLogsConfigEntry = ConfigEntry[SwitchBotLockLogsData]
@@ -67,10 +96,7 @@ async def async_setup(
     hass.data.setdefault(DOMAIN, {})
 
     # Initialize user store (shared across all locks)
-    if "user_store" not in hass.data[DOMAIN]:
-        user_store = SwitchBotLockUserStore(hass)
-        await user_store.async_load()
-        hass.data[DOMAIN]["user_store"] = user_store
+    await _async_get_user_store(hass)
 
     # Register services
     await _async_register_services(hass)
@@ -87,12 +113,7 @@ async def async_setup_entry(
     mac_address = entry.data[CONF_MAC_ADDRESS]
 
     # Ensure user store is initialized
-    if "user_store" not in hass.data[DOMAIN]:
-        user_store = SwitchBotLockUserStore(hass)
-        await user_store.async_load()
-        hass.data[DOMAIN]["user_store"] = user_store
-
-    user_store = hass.data[DOMAIN]["user_store"]
+    user_store = await _async_get_user_store(hass)
 
     # Find the SwitchBot lock device from the core integration
     lock_device = await _get_switchbot_lock_device(hass, device_id)
@@ -103,61 +124,84 @@ async def async_setup_entry(
         )
         raise HomeAssistantError(msg)
 
+    # Find the lock entity for state tracking and availability checks
+    lock_entity_id = await _find_lock_entity_id(hass, device_id)
+    if lock_entity_id is None:
+        LOGGER.warning("Could not find lock entity for device %s", device_id)
+
     # Create log manager
     log_manager = SwitchBotLockLogManager(
         hass,
         lock_device,
         mac_address,
         user_store,
+        lock_entity_id,
+    )
+
+    # Debounce log fetches so bursts of state changes share one timer handle
+    # instead of spawning a Task per event
+    fetch_debouncer: Debouncer[list[dict[str, Any]]] = Debouncer(
+        hass,
+        LOGGER,
+        cooldown=LOG_FETCH_DELAY,
+        immediate=False,
+        function=log_manager.async_fetch_logs,
     )
+    entry.async_on_unload(fetch_debouncer.async_shutdown)
 
     # Store runtime data
     entry.runtime_data = SwitchBotLockLogsData(
         log_manager=log_manager,
+        device_id=device_id,
         mac_address=mac_address,
+        fetch_debouncer=fetch_debouncer,
     )
 
-    # Store log manager for services
-    if "log_managers" not in hass.data[DOMAIN]:
-        hass.data[DOMAIN]["log_managers"] = {}
-    hass.data[DOMAIN]["log_managers"][entry.entry_id] = log_manager
+    # Index log manager by device ID for O(1) service dispatch
+    hass.data[DOMAIN].setdefault("log_managers_by_device", {})[device_id] = log_manager
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # Find the lock entity and subscribe to state changes
-    lock_entity_id = await _find_lock_entity_id(hass, device_id)
+    # Subscribe to lock state changes
     if lock_entity_id:
         LOGGER.debug("Subscribing to state changes for %s", lock_entity_id)
 
+        # Seed the state cache so the first event only fetches on a real
+        # transition, not on the first attribute-only update
+        runtime_data = entry.runtime_data
+        current_state = hass.states.get(lock_entity_id)
+        runtime_data.last_lock_state = current_state.state if current_state else None
+
         @callback
         def _async_on_lock_state_change(event: Event[EventStateChangedData]) -> None:
             """Handle lock state changes."""
-            old_state = event.data["old_state"]
             new_state = event.data["new_state"]
+            if new_state is None:
+                return
 
-            if old_state is None or new_state is None:
+            # Attribute-only updates (battery, rssi) keep the same state
+            # string; only fetch logs on a real transition
+            if new_state.state == runtime_data.last_lock_state:
                 return
+            runtime_data.last_lock_state = new_state.state
 
-            # Only fetch logs if state actually changed
-            if old_state.state != new_state.state:
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
-                    "Lock state changed from %s to %s, fetching logs",
-                    old_state.state,
+                    "Lock state changed to %s, scheduling log fetch",
                     new_state.state,
                 )
-                hass.async_create_task(_async_fetch_logs(log_manager))
+            fetch_debouncer.async_schedule_call()
 
         cancel_listener = async_track_state_change_event(
             hass, [lock_entity_id], _async_on_lock_state_change
         )
         entry.runtime_data.cancel_state_listener = cancel_listener
         entry.async_on_unload(cancel_listener)
-    else:
-        LOGGER.warning("Could not find lock entity for device %s", device_id)
 
-    # Fetch initial logs
-    hass.async_create_task(_async_fetch_logs(log_manager))
+    # Schedule the initial log fetch; the debouncer's cooldown timer fires it
+    # after LOG_FETCH_DELAY without queueing a Task from startup
+    fetch_debouncer.async_schedule_call()
 
     return True
 
@@ -168,25 +212,46 @@ async def async_unload_entry(
 ) -> bool:
     """Unload a config entry."""
     # Remove log manager
-    hass.data[DOMAIN]["log_managers"].pop(entry.entry_id, None)
+    hass.data[DOMAIN].get("log_managers_by_device", {}).pop(
+        entry.runtime_data.device_id, None
+    )
 
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def _async_update_listener(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: SwitchBotLockLogsConfigEntry,
 ) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
-
-
-async def _async_fetch_logs(log_manager: SwitchBotLockLogManager) -> None:
-    """Fetch logs with error handling."""
-    try:
-        await log_manager.async_fetch_logs()
-    except Exception:
-        LOGGER.exception("Error fetching logs")
+    """Handle config entry updates."""
+    data = entry.runtime_data
+
+    # Only a device or MAC change invalidates the log manager and its
+    # state listeners; reloading for anything else would tear down and
+    # rebuild the whole entry (including the initial BLE fetch) for nothing
+    if (
+        entry.data[CONF_DEVICE_ID] != data.device_id
+        or entry.data[CONF_MAC_ADDRESS] != data.mac_address
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_get_user_store(hass: HomeAssistant) -> SwitchBotLockUserStore:
+    """
+    Get the shared user store, loading it from disk on first use.
+
+    Guarded by a lock so concurrent entry setups during startup share one
+    load instead of each constructing a store and overwriting the other.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    lock = domain_data.setdefault("_user_store_lock", asyncio.Lock())
+    async with lock:
+        user_store: SwitchBotLockUserStore | None = domain_data.get("user_store")
+        if user_store is None:
+            user_store = SwitchBotLockUserStore(hass)
+            await user_store.async_load()
+            domain_data["user_store"] = user_store
+    return user_store
 
 
 async def _find_lock_entity_id(hass: HomeAssistant, device_id: str) -> str | None:
@@ -216,30 +281,28 @@ async def _get_switchbot_lock_device(
         return None
 
     # Find the switchbot config entry
-    switchbot_entry_id = None
-    for entry_id in device.config_entries:
-        entry = hass.config_entries.async_get_entry(entry_id)
-        if entry and entry.domain == SWITCHBOT_DOMAIN:
-            switchbot_entry_id = entry_id
-            break
-
-    if not switchbot_entry_id:
+    switchbot_entry = next(
+        (
+            entry
+            for entry_id in device.config_entries
+            if (entry := hass.config_entries.async_get_entry(entry_id))
+            and entry.domain == SWITCHBOT_DOMAIN
+        ),
+        None,
+    )
+
+    if not switchbot_entry:
         LOGGER.error("No SwitchBot config entry found for device: %s", device_id)
         return None
 
-    # Get the config entry and extract the lock device
-    switchbot_entry = hass.config_entries.async_get_entry(switchbot_entry_id)
-    if not switchbot_entry or not hasattr(switchbot_entry, "runtime_data"):
+    # Extract the lock device from the entry's runtime data
+    coordinator = getattr(switchbot_entry, "runtime_data", None)
+    if not coordinator:
         LOGGER.error(
-            "SwitchBot config entry has no runtime data: %s", switchbot_entry_id
+            "SwitchBot config entry has no runtime data: %s", switchbot_entry.entry_id
         )
         return None
 
-    coordinator = switchbot_entry.runtime_data
-    if not coordinator:
-        LOGGER.error("No coordinator in runtime data")
-        return None
-
     lock_device = getattr(coordinator, "device", None)
     if lock_device is None or not isinstance(lock_device, SwitchbotLock):
         LOGGER.error("Device is not a SwitchbotLock: %s", type(lock_device))
@@ -253,20 +316,13 @@ async def _async_register_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, SERVICE_GET_LOCK_LOGS):
         return
 
-    async def async_get_lock_logs(call: ServiceCall) -> ServiceResponse:
+    async def async_get_lock_logs(
+        call: ServiceCall, log_manager: SwitchBotLockLogManager
+    ) -> ServiceResponse:
         """Get lock logs service."""
-        device_id = call.data["device_id"]
         max_entries = call.data.get("max_entries", DEFAULT_LOCK_LOG_MAX_ENTRIES)
         base_time = call.data.get("base_time", 0)
 
-        # Find log manager for this device
-        log_manager = await _find_log_manager_for_device(hass, device_id)
-        if not log_manager:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="device_not_configured",
-            )
-
         try:
             logs = await log_manager.async_fetch_logs(base_time, max_entries)
         except Exception as err:
@@ -277,90 +333,76 @@ async def _async_register_services(hass: HomeAssistant) -> None:
 
         return {"logs": logs}
 
-    async def async_set_lock_user_name(call: ServiceCall) -> None:
+    async def async_set_lock_user_name(
+        call: ServiceCall, log_manager: SwitchBotLockLogManager
+    ) -> ServiceResponse:
         """Set lock user name service."""
-        device_id = call.data["device_id"]
-        user_id = call.data["user_id"]
-        name = call.data["name"]
-
-        log_manager = await _find_log_manager_for_device(hass, device_id)
-        if not log_manager:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="device_not_configured",
-            )
-
         user_store: SwitchBotLockUserStore = hass.data[DOMAIN]["user_store"]
-        await user_store.async_set_user(log_manager.mac, user_id, name)
+        user_store.async_set_user(
+            log_manager.mac, call.data["user_id"], call.data["name"]
+        )
+        return None
 
-    async def async_delete_lock_user_name(call: ServiceCall) -> None:
+    async def async_delete_lock_user_name(
+        call: ServiceCall, log_manager: SwitchBotLockLogManager
+    ) -> ServiceResponse:
         """Delete lock user name service."""
-        device_id = call.data["device_id"]
-        user_id = call.data["user_id"]
+        user_store: SwitchBotLockUserStore = hass.data[DOMAIN]["user_store"]
+        user_store.async_delete_user(log_manager.mac, call.data["user_id"])
+        return None
+
+    handlers = {
+        SERVICE_GET_LOCK_LOGS: async_get_lock_logs,
+        SERVICE_SET_LOCK_USER_NAME: async_set_lock_user_name,
+        SERVICE_DELETE_LOCK_USER_NAME: async_delete_lock_user_name,
+    }
 
-        log_manager = await _find_log_manager_for_device(hass, device_id)
+    async def async_handle_service(call: ServiceCall) -> ServiceResponse:
+        """Resolve the target log manager once, then dispatch to the handler."""
+        log_manager = _find_log_manager_for_device(hass, call.data["device_id"])
         if not log_manager:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="device_not_configured",
             )
 
-        user_store: SwitchBotLockUserStore = hass.data[DOMAIN]["user_store"]
-        await user_store.async_delete_user(log_manager.mac, user_id)
+        return await handlers[call.service](call, log_manager)
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_LOCK_LOGS,
-        async_get_lock_logs,
+        async_handle_service,
         supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_SET_LOCK_USER_NAME, async_set_lock_user_name
+        DOMAIN,
+        SERVICE_SET_LOCK_USER_NAME,
+        async_handle_service,
+        schema=SERVICE_SET_LOCK_USER_NAME_SCHEMA,
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_DELETE_LOCK_USER_NAME, async_delete_lock_user_name
+        DOMAIN,
+        SERVICE_DELETE_LOCK_USER_NAME,
+        async_handle_service,
+        schema=SERVICE_DELETE_LOCK_USER_NAME_SCHEMA,
     )
 
 
-async def _find_log_manager_for_device(
+@callback
+def _find_log_manager_for_device(
     hass: HomeAssistant, device_id: str
 ) -> SwitchBotLockLogManager | None:
     """Find the log manager for a given device ID."""
     log_managers: dict[str, SwitchBotLockLogManager] = hass.data[DOMAIN].get(
-        "log_managers", {}
+        "log_managers_by_device", {}
     )
+    log_manager = log_managers.get(device_id)
 
-    LOGGER.debug(
-        "Looking for log manager for device_id: %s, available managers: %d",
-        device_id,
-        len(log_managers),
-    )
+    if log_manager is None and LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "No log manager found for device_id: %s. Configured devices: %s",
+            device_id,
+            list(log_managers),
+        )
 
-    # Look for entry that matches this device
-    for entry_id, log_manager in log_managers.items():
-        entry = hass.config_entries.async_get_entry(entry_id)
-        if entry:
-            entry_device_id = entry.data.get(CONF_DEVICE_ID)
-            LOGGER.debug(
-                "Checking entry %s with device_id: %s (match: %s)",
-                entry_id,
-                entry_device_id,
-                entry_device_id == device_id,
-            )
-            if entry_device_id == device_id:
-                LOGGER.debug("Found matching log manager for device %s", device_id)
-                return log_manager
-
-    LOGGER.warning(
-        "No log manager found for device_id: %s. Available entries: %s",
-        device_id,
-        [
-            (
-                entry_id,
-                hass.config_entries.async_get_entry(entry_id).data.get(CONF_DEVICE_ID),
-            )
-            for entry_id in log_managers
-            if hass.config_entries.async_get_entry(entry_id)
-        ],
-    )
-    return None
+    return log_manager
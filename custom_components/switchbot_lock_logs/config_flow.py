@@ -93,39 +93,37 @@ class SwitchBotLockLogsConfigFlow(ConfigFlow, domain=DOMAIN):
         self._available_locks = {}
         dev_reg = dr.async_get(self.hass)
 
-        # Get all devices
-        for device in dev_reg.devices.values():
-            # Check if device belongs to switchbot integration
-            is_switchbot = False
-            for entry_id in device.config_entries:
-                entry = self.hass.config_entries.async_get_entry(entry_id)
-                if entry and entry.domain == SWITCHBOT_DOMAIN:
-                    is_switchbot = True
-                    # Check if it's a lock based on the sensor_type in entry data
-                    sensor_type = entry.data.get("sensor_type", "")
-                    if sensor_type in LOCK_MODELS:
-                        # Extract MAC from connections
-                        mac = None
-                        for connection in device.connections:
-                            if connection[0] == dr.CONNECTION_BLUETOOTH:
-                                mac = connection[1]
-                                break
-
-                        if mac:
-                            # Check if not already configured for this integration
-                            existing_entries = self.hass.config_entries.async_entries(
-                                DOMAIN
-                            )
-                            already_configured = any(
-                                e.data.get(CONF_DEVICE_ID) == device.id
-                                for e in existing_entries
-                            )
-
-                            if not already_configured:
-                                self._available_locks[device.id] = {
-                                    "name": device.name or "SwitchBot Lock",
-                                    "mac": mac,
-                                }
-                    break
+        # Devices already configured for this integration
+        already_configured_ids = {
+            entry.data.get(CONF_DEVICE_ID)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+
+        # Iterate the (typically few) SwitchBot config entries and only
+        # inspect their devices, instead of scanning every device in HA
+        for entry in self.hass.config_entries.async_entries(SWITCHBOT_DOMAIN):
+            # Check if it's a lock based on the sensor_type in entry data
+            if entry.data.get("sensor_type", "") not in LOCK_MODELS:
+                continue
+
+            for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
+                # Skip devices already configured for this integration
+                if device.id in already_configured_ids:
+                    continue
+
+                # Extract MAC from connections
+                mac = next(
+                    (
+                        connection[1]
+                        for connection in device.connections
+                        if connection[0] == dr.CONNECTION_BLUETOOTH
+                    ),
+                    None,
+                )
+                if mac:
+                    self._available_locks[device.id] = {
+                        "name": device.name or "SwitchBot Lock",
+                        "mac": mac,
+                    }
 
         LOGGER.debug("Found %d available SwitchBot locks", len(self._available_locks))
@@ -19,6 +19,10 @@ CONF_MAC_ADDRESS: Final = "mac_address"
 # Lock Log Defaults
 DEFAULT_LOCK_LOG_MAX_ENTRIES: Final = 20
 
+# Seconds to wait after a lock state change before fetching logs. Bursts of
+# state changes within this window collapse into a single BLE fetch.
+LOG_FETCH_DELAY: Final = 1.0
+
 # Services
 SERVICE_GET_LOCK_LOGS: Final = "get_lock_logs"
 SERVICE_SET_LOCK_USER_NAME: Final = "set_lock_user_name"
@@ -28,5 +32,8 @@ SERVICE_DELETE_LOCK_USER_NAME: Final = "delete_lock_user_name"
 STORAGE_KEY_LOCK_USERS: Final = "switchbot_lock_logs_users"
 STORAGE_VERSION_LOCK_USERS: Final = 1
 
+# Seconds to delay storage writes so rapid mutations coalesce into one save
+STORAGE_SAVE_DELAY: Final = 1.0
+
 # Lock model types (from core switchbot const.py)
-LOCK_MODELS: Final = {"lock", "lock_pro", "lock_lite", "lock_ultra"}
+LOCK_MODELS: Final = frozenset({"lock", "lock_pro", "lock_lite", "lock_ultra"})
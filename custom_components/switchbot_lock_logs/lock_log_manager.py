@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import Any
 
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, callback
 from switchbot import SwitchbotLock
 from switchbot.const import LockLogAction, LockLogSource
@@ -12,6 +14,18 @@ from switchbot.const import LockLogAction, LockLogSource
 from .const import LOGGER
 from .storage import SwitchBotLockUserStore
 
+# Display strings for the small fixed enum domains, precomputed once at import
+# so enrichment does two dict lookups per log instead of enum construction and
+# string manipulation (plus a raised ValueError for unknown codes). The values
+# are interned so repeated state writes compare them by pointer downstream.
+_SOURCE_DISPLAY = {
+    m.value: sys.intern(m.name.replace("_", " ").title()) for m in LockLogSource
+}
+_ACTION_NAME = {m.value: sys.intern(m.name.lower()) for m in LockLogAction}
+
+# First payload byte marking a user-attributed log entry
+_USER_PAYLOAD_MARKER = 0x59
+
 
 class SwitchBotLockLogManager:
     """Manage lock logs for a single lock device."""
@@ -22,35 +36,44 @@ class SwitchBotLockLogManager:
         lock_device: SwitchbotLock,
         mac: str,
         user_store: SwitchBotLockUserStore,
+        lock_entity_id: str | None = None,
     ) -> None:
         """Initialize the log manager."""
         self._hass = hass
         self._lock_device = lock_device
         self._mac = mac
         self._user_store = user_store
-        self._latest_logs: list[dict[str, Any]] = []
-        self._listeners: list[Callable[[], None]] = []
+        self._lock_entity_id = lock_entity_id
+        self._latest_logs: tuple[dict[str, Any], ...] = ()
+        self._last_notify_key: tuple[Any, Any, Any] | None = None
+        self._listeners: set[Callable[[tuple[dict[str, Any], ...]], None]] = set()
 
     @callback
-    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+    def async_add_listener(
+        self, listener: Callable[[tuple[dict[str, Any], ...]], None]
+    ) -> Callable[[], None]:
         """
         Add a listener to be notified of log updates.
 
+        Listeners receive the newly added log entries (newest first), so
+        they never have to re-scan the full cached history. They must be
+        lightweight callbacks: dispatch invokes them synchronously in the
+        event loop, with no task or threadsafe hop per listener.
+
         Returns a function to remove the listener.
         """
-        self._listeners.append(listener)
+        self._listeners.add(listener)
 
         def remove_listener() -> None:
-            if listener in self._listeners:
-                self._listeners.remove(listener)
+            self._listeners.discard(listener)
 
         return remove_listener
 
     @callback
-    def _notify_listeners(self) -> None:
-        """Notify all listeners of log update."""
-        for listener in self._listeners:
-            listener()
+    def _notify_listeners(self, new_logs: tuple[dict[str, Any], ...]) -> None:
+        """Notify all listeners of newly added logs."""
+        for listener in list(self._listeners):
+            listener(new_logs)
 
     async def async_fetch_logs(
         self, base_time: int = 0, max_entries: int = 10
@@ -64,6 +87,15 @@ class SwitchBotLockLogManager:
         This method handles BLE errors gracefully and returns cached logs
         if the fetch fails.
         """
+        # Skip the BLE round-trip when the lock is unreachable; it would
+        # only block for seconds before failing
+        if self._lock_entity_id and (
+            (state := self._hass.states.get(self._lock_entity_id)) is None
+            or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        ):
+            LOGGER.debug("Lock %s is unavailable, skipping log fetch", self._mac)
+            return list(self._latest_logs)
+
         # Fetch from BLE device
         LOGGER.debug("Fetching logs for %s", self._mac)
 
@@ -76,7 +108,7 @@ class SwitchBotLockLogManager:
                 err,
             )
             # Return cached logs on error - don't clear existing data
-            return self._latest_logs.copy()
+            return list(self._latest_logs)
 
         if not logs:
             LOGGER.debug("No logs retrieved for %s", self._mac)
@@ -85,57 +117,64 @@ class SwitchBotLockLogManager:
         LOGGER.debug("Retrieved %d logs for %s", len(logs), self._mac)
 
         # Enrich with user names
-        enriched_logs = await self._enrich_logs(logs)
-
-        # Store for sensors to read
-        self._latest_logs = enriched_logs
-
-        # Notify all sensor entities to update their state
-        self._notify_listeners()
+        enriched_logs = self._enrich_logs(logs)
+
+        # Store an immutable snapshot for sensors to read
+        previous_logs = self._latest_logs
+        self._latest_logs = tuple(enriched_logs)
+
+        # Only notify sensors when the newest entry actually changed;
+        # unchanged re-fetches would otherwise cascade into state writes
+        top = enriched_logs[0]
+        notify_key = (top.get("timestamp"), top.get("action"), top.get("source"))
+        if notify_key != self._last_notify_key:
+            self._last_notify_key = notify_key
+
+            # Hand listeners just the entries newer than the previous top,
+            # falling back to the full snapshot if the window shifted
+            previous_top_ts = (
+                previous_logs[0].get("timestamp", 0) if previous_logs else 0
+            )
+            new_logs = tuple(
+                log
+                for log in self._latest_logs
+                if log.get("timestamp", 0) > previous_top_ts
+            )
+            self._notify_listeners(new_logs or self._latest_logs)
 
         return enriched_logs
 
-    async def _enrich_logs(self, logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _enrich_logs(self, logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Add user names and human-readable fields to logs."""
-        users = await self._user_store.async_get_users(self._mac)
-
-        enriched = []
-        for log in logs:
-            # Extract user ID from payload if present
-            user_id = self._extract_user_id(log.get("payload", ""))
-
-            # Determine user name (only for mapped users with IDs)
-            if user_id is not None and str(user_id) in users:
-                # User ID exists and is mapped to a name
-                user_name = users[str(user_id)]
-            else:
-                # No user ID or not mapped - leave as None for sensor
-                user_name = None
-
-            # Determine source name for activity tracking
-            try:
-                source_name = LockLogSource(log["source"]).name
-                source_display = source_name.replace("_", " ").title()
-            except (ValueError, KeyError):
-                source_display = f"Unknown (Source {log.get('source', '?')})"
-
-            # Add human-readable action
-            try:
-                action_name = LockLogAction(log["action"]).name.lower()
-            except (ValueError, KeyError):
-                action_name = f"unknown_{log.get('action', '?')}"
-
-            # Add enriched fields
-            enriched_log = {
-                **log,
-                "user_id": user_id,
-                "user_name": user_name,
-                "source_display": source_display,
-                "action_name": action_name,
-            }
-            enriched.append(enriched_log)
-
-        return enriched
+        users = self._user_store.async_get_users(self._mac)
+        # With no users mapped there is nothing to resolve, so skip the
+        # per-log payload parsing entirely
+        has_users = bool(users)
+
+        # Bind the per-log helpers to locals; LOAD_FAST beats repeated
+        # attribute and global lookups in this loop. A user name is only
+        # set for mapped users; None tells the sensor "unmapped".
+        extract_user_id = self._extract_user_id
+        get_user_name = users.get
+        get_source_display = _SOURCE_DISPLAY.get
+        get_action_name = _ACTION_NAME.get
+
+        return [
+            dict(
+                log,
+                user_id=(
+                    user_id := (
+                        extract_user_id(log.get("payload", "")) if has_users else None
+                    )
+                ),
+                user_name=(get_user_name(user_id) if user_id is not None else None),
+                source_display=get_source_display(log.get("source"))
+                or f"Unknown (Source {log.get('source', '?')})",
+                action_name=get_action_name(log.get("action"))
+                or f"unknown_{log.get('action', '?')}",
+            )
+            for log in logs
+        ]
 
     @staticmethod
     def _extract_user_id(payload: str) -> int | None:
@@ -150,15 +189,17 @@ class SwitchBotLockLogManager:
         if not payload or len(payload) < 6:
             return None
 
+        # fromhex skips ASCII whitespace, so the slice can decode to fewer
+        # than 3 bytes; IndexError covers those short prefixes
         try:
-            # Check for pattern 0x59XX (any type)
-            if payload[0:2] == "59" and payload[2:4] in ("01", "03"):
-                # Extract byte 2 (characters 4-5) - user ID
-                user_id = int(payload[4:6], 16)
+            prefix = bytes.fromhex(payload[:6])
+            # Check for pattern 0x59 0x01/0x03; byte 2 is the user ID
+            if prefix[0] == _USER_PAYLOAD_MARKER and prefix[1] in (0x01, 0x03):
+                user_id = prefix[2]
                 # User ID 0 means no user (system action)
-                return user_id if user_id > 0 else None
+                return user_id if user_id else None
         except (ValueError, IndexError):
-            pass
+            return None
 
         return None
 
@@ -168,9 +209,9 @@ class SwitchBotLockLogManager:
         return self._latest_logs[0] if self._latest_logs else None
 
     @property
-    def latest_logs(self) -> list[dict[str, Any]]:
-        """Get all cached logs."""
-        return self._latest_logs.copy()
+    def latest_logs(self) -> tuple[dict[str, Any], ...]:
+        """Get all cached logs as a read-only snapshot."""
+        return self._latest_logs
 
     @property
     def mac(self) -> str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -11,12 +12,14 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
     CONF_DEVICE_ID,
     CONF_DEVICE_NAME,
     CONF_MAC_ADDRESS,
+    LOGGER,
     SWITCHBOT_DOMAIN,
 )
 
@@ -27,6 +30,31 @@ if TYPE_CHECKING:
     from . import SwitchBotLockLogsConfigEntry
     from .lock_log_manager import SwitchBotLockLogManager
 
+# Seconds to wait before writing state after a log update, so a burst of
+# fetches collapses into one write per sensor
+UPDATE_DEBOUNCE_COOLDOWN = 0.1
+
+# Interned so the common all-zero system-event payload compares by pointer
+_ZERO_PAYLOAD = sys.intern("000000000000")
+
+# Interned defaults reused across every attribute dict the sensors emit
+_UNKNOWN = sys.intern("Unknown")
+_UNKNOWN_LC = sys.intern("unknown")
+
+# DeviceInfo is immutable in practice, so all sensors of a lock share one
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
+
+def _is_valid_payload(payload: str) -> bool:
+    """
+    Check if payload is valid (non-zero).
+
+    A valid payload indicates a real user action rather than a system event.
+    """
+    if not payload or len(payload) < 6:
+        return False
+    return payload is not _ZERO_PAYLOAD and payload != _ZERO_PAYLOAD
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,6 +82,18 @@ async def async_setup_entry(
 class SwitchBotLockLogSensorBase(SensorEntity):
     """Base class for lock log sensors."""
 
+    # Entity still provides __dict__ for _attr_* values, but slotting the
+    # attributes touched on every dispatch gives them descriptor access
+    # and trims per-instance memory
+    __slots__ = (
+        "_device_id",
+        "_device_name",
+        "_log_manager",
+        "_mac_address",
+        "_pending_logs",
+        "_update_debouncer",
+    )
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -69,27 +109,63 @@ class SwitchBotLockLogSensorBase(SensorEntity):
         self._device_id = device_id
         self._device_name = device_name
         self._mac_address = mac_address
+        self._update_debouncer: Debouncer[None] | None = None
+        self._pending_logs: list[dict[str, Any]] = []
 
         # Link to the parent SwitchBot device
-        self._attr_device_info = DeviceInfo(
-            identifiers={(SWITCHBOT_DOMAIN, mac_address)},
-        )
+        if (device_info := _DEVICE_INFO_CACHE.get(mac_address)) is None:
+            device_info = _DEVICE_INFO_CACHE.setdefault(
+                mac_address,
+                DeviceInfo(identifiers={(SWITCHBOT_DOMAIN, mac_address)}),
+            )
+        self._attr_device_info = device_info
 
     async def async_added_to_hass(self) -> None:
         """Register for log updates."""
+        # Debounce dispatches so a burst of log updates coalesces into a
+        # single state write instead of one per fetch
+        self._update_debouncer = Debouncer(
+            self.hass,
+            LOGGER,
+            cooldown=UPDATE_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._handle_log_update,
+        )
+        self.async_on_remove(self._update_debouncer.async_shutdown)
         self.async_on_remove(
-            self._log_manager.async_add_listener(self._handle_log_update)
+            self._log_manager.async_add_listener(self._async_on_log_update)
         )
 
+    @callback
+    def _async_on_log_update(self, new_logs: tuple[dict[str, Any], ...]) -> None:
+        """Queue newly added logs and schedule a debounced state write."""
+        # Each batch is newest first and later batches are newer, so
+        # prepend to keep the pending list newest first overall
+        self._pending_logs[:0] = new_logs
+        if self._update_debouncer:
+            self._update_debouncer.async_schedule_call()
+
     @callback
     def _handle_log_update(self) -> None:
-        """Handle log update notification."""
+        """Handle debounced log update notification."""
+        # Cheap short-circuit for dispatches racing entity registration
+        if self.hass is None or self.entity_id is None:
+            return
+        self._pending_logs.clear()
         self.async_write_ha_state()
 
 
 class SwitchBotLockLastActivitySensor(SwitchBotLockLogSensorBase):
     """Sensor showing last lock activity timestamp."""
 
+    __slots__ = (
+        "_attrs_cache",
+        "_attrs_cache_src",
+        "_cached_dt",
+        "_cached_ts",
+        "_last_written_ts",
+    )
+
     _attr_translation_key = "last_activity"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:clock-outline"
@@ -105,13 +181,42 @@ class SwitchBotLockLastActivitySensor(SwitchBotLockLogSensorBase):
         super().__init__(log_manager, device_id, device_name, mac_address)
         self._attr_unique_id = f"{mac_address}-last_activity"
         self._attr_name = "Last activity"
+        self._cached_ts: int | None = None
+        self._cached_dt: datetime | None = None
+        self._last_written_ts: int | None = None
+        self._attrs_cache_src: dict[str, Any] | None = None
+        self._attrs_cache: dict[str, Any] = {}
+
+    @callback
+    def _handle_log_update(self) -> None:
+        """Handle debounced log update notification."""
+        # Cheap short-circuit for dispatches racing entity registration
+        if self.hass is None or self.entity_id is None:
+            return
+        self._pending_logs.clear()
+
+        # Skip the state write entirely when the newest timestamp has not
+        # moved; writing identical state still costs a State build
+        latest = self._log_manager.latest_log
+        timestamp = latest["timestamp"] if latest else None
+        if timestamp == self._last_written_ts:
+            return
+        self._last_written_ts = timestamp
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> datetime | None:
         """Return timestamp of last activity."""
-        if latest := self._log_manager.latest_log:
-            return datetime.fromtimestamp(latest["timestamp"], tz=UTC)
-        return None
+        if not (latest := self._log_manager.latest_log):
+            return None
+
+        # HA reads native_value on every state write; only rebuild the
+        # datetime when the underlying timestamp moved
+        ts = latest["timestamp"]
+        if ts != self._cached_ts:
+            self._cached_ts = ts
+            self._cached_dt = datetime.fromtimestamp(ts, tz=UTC)
+        return self._cached_dt
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -119,17 +224,32 @@ class SwitchBotLockLastActivitySensor(SwitchBotLockLogSensorBase):
         if not (latest := self._log_manager.latest_log):
             return {}
 
-        return {
-            "user_name": latest.get("user_name") or "Unknown",
-            "action": latest.get("action_name", "unknown"),
-            "source": latest.get("source_display", "unknown"),
-            "user_id": latest.get("user_id"),
-        }
+        # Only rebuild when the underlying log dict changes identity; HA
+        # reads attributes on every state write and template eval. Holding
+        # the dict itself (not its id) keeps the comparison valid after the
+        # manager drops the old snapshot and the address gets reused.
+        if latest is not self._attrs_cache_src:
+            self._attrs_cache_src = latest
+            get = latest.get
+            self._attrs_cache = {
+                "user_name": get("user_name") or _UNKNOWN,
+                "action": get("action_name", _UNKNOWN_LC),
+                "source": get("source_display", _UNKNOWN_LC),
+                "user_id": get("user_id"),
+            }
+        return self._attrs_cache
 
 
 class SwitchBotLockLastUserSensor(SwitchBotLockLogSensorBase):
     """Sensor showing who last used the lock."""
 
+    __slots__ = (
+        "_attrs_cache",
+        "_attrs_cache_src",
+        "_current_log",
+        "_last_processed_timestamp",
+    )
+
     _attr_translation_key = "last_user"
     _attr_icon = "mdi:account"
 
@@ -146,42 +266,50 @@ class SwitchBotLockLastUserSensor(SwitchBotLockLogSensorBase):
         self._attr_name = "Last user"
         self._last_processed_timestamp: int = 0
         self._current_log: dict[str, Any] | None = None
+        self._attrs_cache_src: dict[str, Any] | None = None
+        self._attrs_cache: dict[str, Any] = {}
 
     @callback
     def _handle_log_update(self) -> None:
         """
-        Handle log update notification.
+        Handle debounced log update notification.
 
-        Filters logs to find the newest entry that:
+        Filters the pending delta to find the newest entry that:
         - Is newer than the last processed timestamp
         - Has a non-zero payload (indicating a real user action)
         """
-        new_log = self._get_newest_valid_log()
-        if new_log:
-            self._current_log = new_log
-            self._last_processed_timestamp = new_log.get("timestamp", 0)
+        # Cheap short-circuit for dispatches racing entity registration
+        if self.hass is None or self.entity_id is None:
+            return
+        result = self._get_newest_valid_log()
+        self._pending_logs.clear()
+        if result is None:
+            # Nothing new and valid, so the state would be unchanged
+            return
+        self._current_log, self._last_processed_timestamp = result
         self.async_write_ha_state()
 
-    def _get_newest_valid_log(self) -> dict[str, Any] | None:
-        """Get the newest log that is valid and newer than last processed."""
-        for log in self._log_manager.latest_logs:
-            timestamp = log.get("timestamp", 0)
-            if timestamp > self._last_processed_timestamp and self._is_valid_payload(
-                log.get("payload", "")
-            ):
-                return log
-        return None
-
-    @staticmethod
-    def _is_valid_payload(payload: str) -> bool:
+    def _get_newest_valid_log(self) -> tuple[dict[str, Any], int] | None:
         """
-        Check if payload is valid (non-zero).
+        Get the newest pending log that is valid and newer than last processed.
 
-        A valid payload indicates a real user action rather than a system event.
+        Returns the log together with its timestamp, which the scan has
+        already read, so the caller does not look it up again.
         """
-        if not payload or len(payload) < 6:
-            return False
-        return payload != "000000000000"
+        # Pending logs are newest first, so return on the first match.
+        # Real entries always carry both keys, so direct subscripts with a
+        # KeyError guard beat paying .get's default handling per log
+        last_ts = self._last_processed_timestamp
+        is_valid = _is_valid_payload
+        for log in self._pending_logs:
+            try:
+                timestamp = log["timestamp"]
+                payload = log["payload"]
+            except KeyError:
+                continue
+            if timestamp > last_ts and is_valid(payload):
+                return log, timestamp
+        return None
 
     @property
     def native_value(self) -> str | None:
@@ -193,19 +321,25 @@ class SwitchBotLockLastUserSensor(SwitchBotLockLogSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        if not self._current_log:
+        if not (current := self._current_log):
             return {}
 
-        attributes: dict[str, Any] = {
-            "last_activity": self._current_log.get("source_display", "Unknown"),
-            "last_activity_timestamp": self._current_log.get("timestamp"),
-            "last_activity_action": self._current_log.get("action_name", "unknown"),
-            "source": self._current_log.get("source"),
-            "payload": self._current_log.get("payload"),
-        }
-
-        # Add user_id only if present
-        if self._current_log.get("user_id") is not None:
-            attributes["user_id"] = self._current_log["user_id"]
-
-        return attributes
+        # Only rebuild when the current log changes identity; compare the
+        # held dict itself so a reused address never serves stale attributes
+        if current is not self._attrs_cache_src:
+            self._attrs_cache_src = current
+            get = current.get
+            attributes: dict[str, Any] = {
+                "last_activity": get("source_display", _UNKNOWN),
+                "last_activity_timestamp": get("timestamp"),
+                "last_activity_action": get("action_name", _UNKNOWN_LC),
+                "source": get("source"),
+                "payload": get("payload"),
+            }
+
+            # Add user_id only if present
+            if (user_id := get("user_id")) is not None:
+                attributes["user_id"] = user_id
+
+            self._attrs_cache = attributes
+        return self._attrs_cache
@@ -2,10 +2,37 @@
 
 from __future__ import annotations
 
-from homeassistant.core import HomeAssistant
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY_LOCK_USERS, STORAGE_VERSION_LOCK_USERS
+from .const import (
+    LOGGER,
+    STORAGE_KEY_LOCK_USERS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION_LOCK_USERS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Shared read-only sentinel so lookup misses never allocate; callers must
+# treat the returned mapping as immutable
+_EMPTY_USERS: Mapping[int, str] = MappingProxyType({})
+
+
+def _int_user_key(user_id: str) -> int | str:
+    """Convert a persisted user-ID key to int, keeping unparseable keys as-is."""
+    try:
+        return int(user_id)
+    except (TypeError, ValueError):
+        LOGGER.warning(
+            "Stored user ID %r is not an integer and will not match any log",
+            user_id,
+        )
+        return user_id
 
 
 class SwitchBotLockUserStore:
@@ -22,45 +49,78 @@ class SwitchBotLockUserStore:
     async def async_load(self) -> None:
         """Load data from storage."""
         if data := await self._store.async_load():
-            self._data = data
+            # JSON forces string keys on disk; convert user IDs to int once
+            # here so the per-log runtime lookups use int keys directly.
+            # Keys older versions persisted without coercion stay as-is so a
+            # bad entry degrades to an unmapped user instead of failing setup.
+            self._data = {
+                mac: {
+                    "name": lock_data.get("name"),
+                    "users": {
+                        _int_user_key(user_id): name
+                        for user_id, name in lock_data.get("users", {}).items()
+                    },
+                }
+                for mac, lock_data in data.items()
+            }
         else:
             self._data = {}
 
     async def async_save(self) -> None:
-        """Save data to storage."""
-        await self._store.async_save(self._data)
+        """Save data to storage immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed save so rapid mutations coalesce into one write."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
 
-    async def async_get_lock_data(self, mac: str) -> dict:
-        """Get all data for a lock."""
-        return self._data.get(mac, {"name": None, "users": {}})
+    @callback
+    def _data_to_save(self) -> dict[str, dict]:
+        """Return data to persist, remapping user IDs to JSON-safe string keys."""
+        return {
+            mac: {
+                "name": lock_data.get("name"),
+                "users": {
+                    str(user_id): name
+                    for user_id, name in lock_data.get("users", {}).items()
+                },
+            }
+            for mac, lock_data in self._data.items()
+        }
 
-    async def async_get_users(self, mac: str) -> dict[str, str]:
-        """Get user mappings for a lock."""
-        lock_data = await self.async_get_lock_data(mac)
-        return lock_data.get("users", {})
+    @callback
+    def async_get_users(self, mac: str) -> Mapping[int, str]:
+        """Get user mappings for a lock, keyed by integer user ID."""
+        lock_data = self._data.get(mac)
+        return lock_data["users"] if lock_data else _EMPTY_USERS
 
-    async def async_set_user(self, mac: str, user_id: int, name: str) -> None:
+    @callback
+    def async_set_user(self, mac: str, user_id: int, name: str) -> None:
         """Set a user name mapping."""
         if mac not in self._data:
             self._data[mac] = {"name": None, "users": {}}
-        self._data[mac]["users"][str(user_id)] = name
-        await self.async_save()
+        self._data[mac]["users"][user_id] = name
+        self._async_schedule_save()
 
-    async def async_delete_user(self, mac: str, user_id: int) -> None:
+    @callback
+    def async_delete_user(self, mac: str, user_id: int) -> None:
         """Delete a user name mapping."""
         if mac in self._data and "users" in self._data[mac]:
-            self._data[mac]["users"].pop(str(user_id), None)
-            await self.async_save()
+            self._data[mac]["users"].pop(user_id, None)
+            self._async_schedule_save()
 
-    async def async_set_lock_name(self, mac: str, name: str) -> None:
+    @callback
+    def async_set_lock_name(self, mac: str, name: str) -> None:
         """Set lock friendly name."""
         if mac not in self._data:
             self._data[mac] = {"name": name, "users": {}}
         else:
             self._data[mac]["name"] = name
-        await self.async_save()
+        self._async_schedule_save()
 
-    async def async_get_lock_name(self, mac: str) -> str | None:
+    @callback
+    def async_get_lock_name(self, mac: str) -> str | None:
         """Get lock friendly name."""
-        lock_data = await self.async_get_lock_data(mac)
-        return lock_data.get("name")
+        lock_data = self._data.get(mac)
+        return lock_data["name"] if lock_data else None